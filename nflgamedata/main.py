@@ -1,24 +1,556 @@
-import requests
-import json
+import aiohttp
+import aiosqlite
+import asyncio
+import orjson
 import os
+import simdjson
+import sys
+import threading
 import time
-from typing import Dict, Optional
-from datetime import datetime
+from aiohttp_client_cache import CachedResponse, CachedSession, SQLiteBackend
+from aiohttp_client_cache.cache_control import get_expiration_datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+from datetime import date, timedelta
+from tqdm import tqdm
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Session-wide HTTP response cache lifetime, used by requests that don't set
+# their own (play-by-play and team statistics)
+DEFAULT_CACHE_TTL = timedelta(days=30)
+
+# Game summaries are cached for a minute, since games in progress go stale
+# quickly; once a summary shows the game completed it is kept forever
+LIVE_GAME_CACHE_TTL = 60
+
+# Scoreboards of past seasons are final and never expire; the current season's
+# scoreboards change as games are played
+NEVER_EXPIRE = -1
+CURRENT_SEASON_CACHE_TTL = 300
+
+# Transient failures are retried with exponential backoff (1s, 2s, 4s, ...),
+# or after the delay in the response's Retry-After header when there is one,
+# capped at MAX_RETRY_DELAY seconds since a retrying game holds a fetch slot
+RETRY_ATTEMPTS = 5
+RETRY_BACKOFF = 1.0
+MAX_RETRY_DELAY = 60.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Idle keep-alive connections are held this long (seconds) so the pool survives
+# pauses between weeks, and a stalled request gives up after REQUEST_TIMEOUT
+KEEPALIVE_TIMEOUT = 60
+# Both ESPN hosts are resolved once per DNS_CACHE_TTL seconds, not every 10s
+DNS_CACHE_TTL = 300
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Maximum number of extracted games kept in memory per fetcher
+EXTRACT_CACHE_SIZE = 512
+
+# Maximum number of decoded scoreboards kept in memory per fetcher
+SCOREBOARD_CACHE_SIZE = 512
+
+# Top-level summary keys the extractors read; season downloads skip decoding the rest
+SUMMARY_KEYS = ("header", "boxscore", "scoringPlays")
+
+# Top-level scoreboard keys callers read; the league calendar and other metadata are skipped
+SCOREBOARD_KEYS = ("events",)
+
+# Player stat categories kept in the clean game data
+KEY_CATEGORIES = frozenset({"passing", "rushing", "receiving", "defensive"})
+
+# Stat labels used when ESPN's labels don't line up with a player's stats
+FALLBACK_LABELS = {
+    "passing": ("C/ATT", "YDS", "AVG", "TD", "INT", "SACKS", "QBR", "RTG"),
+    "rushing": ("CAR", "YDS", "AVG", "TD", "LONG"),
+    "receiving": ("REC", "YDS", "AVG", "TD", "LONG", "TGTS"),
+}
+
+# Threads that extract and write downloaded games while fetching continues
+WRITER_THREADS = 4
+
+
+def dig(data, *keys):
+    """Look up a nested value by successive keys or list indexes.
+    
+    Returns None as soon as a key is missing, where chained .get(key, {}) calls
+    would allocate an empty dict at every level.
+    
+    Args:
+        data: Nested dicts/lists from the ESPN API
+        keys: Keys (or list indexes) to follow, outermost first
+    """
+    try:
+        for key in keys:
+            data = data[key]
+        return data
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def score_int(value) -> int:
+    """Convert an ESPN score to int, skipping int() when it is already one.
+    
+    Scores arrive as short numeric strings ("21") or ints; missing or empty
+    scores count as 0.
+    
+    Args:
+        value: Raw score value from the ESPN API
+    """
+    return value if type(value) is int else int(value) if value else 0
+
+
+def play_text(play) -> str:
+    """Return the display text of a play-by-play item.
+    
+    ESPN puts it under text (a string, or a dict with shortText/text),
+    description or play.text depending on the endpoint.
+    
+    Args:
+        play: One item from a play-by-play response
+    """
+    # Most plays carry text.shortText; only the others pay for the checks below
+    try:
+        return play["text"]["shortText"]
+    except (KeyError, TypeError):
+        pass
+    
+    if not isinstance(play, dict):
+        return str(play)
+    if "text" in play:
+        text = play["text"]
+        if isinstance(text, dict):
+            return text.get("shortText", text.get("text", "N/A"))
+        return text
+    return play.get("description", play.get("play", {}).get("text", "N/A"))
+
+
+def play_text_extractor(play) -> Callable:
+    """Return a function that reads the display text of plays shaped like play.
+    
+    A play-by-play response uses one schema for all of its items, so the
+    schema is sniffed from one play instead of re-checked for every play.
+    The returned function raises KeyError or TypeError on a play of another
+    shape; play_text() handles any shape.
+    
+    Args:
+        play: One item from a play-by-play response
+    """
+    if isinstance(play, dict) and "text" in play:
+        if isinstance(play["text"], dict):
+            if "shortText" in play["text"]:
+                return lambda p: p["text"]["shortText"]
+        elif isinstance(play["text"], str):
+            return _plain_play_text
+    return play_text
+
+
+def _plain_play_text(play) -> str:
+    """Read a play's text, raising TypeError unless it is a plain string."""
+    text = play["text"]
+    if type(text) is not str:
+        raise TypeError(f"Expected string play text, got {type(text).__name__}")
+    return text
+
+
+def current_season() -> int:
+    """Return the year of the NFL season in progress (or most recently finished).
+    
+    A season runs from September into February, so January and February
+    games belong to the previous year's season.
+    """
+    today = date.today()
+    return today.year if today.month >= 3 else today.year - 1
+
+
+class SeasonWriter:
+    """Append clean game data to a season JSONL file, one game per line.
+    
+    The index mapping each game ID to the byte offset of its line, which
+    tells re-runs which games are already saved, is rebuilt from the season
+    file on entry and written to a side index file for random access on
+    exit. append() is safe to call from multiple writer threads.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.index_path = os.path.splitext(path)[0] + ".index.json"
+        self.index: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._file = None
+    
+    def __enter__(self):
+        self.index = self._scan()
+        self._file = open(self.path, "ab")
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        with open(self.index_path, "wb") as f:
+            f.write(orjson.dumps(self.index))
+    
+    def _scan(self) -> Dict[str, int]:
+        """Index the games already in the season file.
+        
+        The season file, not the side index, is the record of what was saved:
+        a run that was killed never wrote its index. A last line cut short by
+        such a run has no trailing newline and is truncated away.
+        """
+        index = {}
+        if not os.path.exists(self.path):
+            return index
+        
+        with open(self.path, "r+b") as f:
+            offset = 0
+            for line in f:
+                if not line.endswith(b"\n"):
+                    f.truncate(offset)
+                    break
+                game_id = orjson.loads(line).get("game_id")
+                if game_id:
+                    index[game_id] = offset
+                offset += len(line)
+        return index
+    
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self.index
+    
+    def __len__(self) -> int:
+        return len(self.index)
+    
+    def append(self, game_id: str, game_data: Dict) -> None:
+        """Write one game as a JSON line and record its offset.
+        
+        Args:
+            game_id: ESPN event ID for the game
+            game_data: Clean game data to save
+        """
+        line = orjson.dumps(game_data, option=orjson.OPT_APPEND_NEWLINE)
+        with self._lock:
+            self.index[game_id] = self._file.tell()
+            self._file.write(line)
+
+
+def iter_season_games(year: int = 2023, output_dir: str = "nflgames"):
+    """Yield the clean game data saved for a season, one game at a time.
+    
+    Reads nfl_<year>.jsonl line by line, so memory use stays flat however
+    many games the season file holds.
+    
+    Args:
+        year: NFL season year, as passed to download_season_games
+        output_dir: Directory holding the season file
+    """
+    with open(os.path.join(output_dir, f"nfl_{year}.jsonl"), "rb") as f:
+        for line in f:
+            yield orjson.loads(line)
+
+
+def build_season_dataframe(year: int = 2023, output_dir: str = "nflgames") -> Tuple["pd.DataFrame", "pd.DataFrame"]:
+    """Load a downloaded season into scoring-plays and player-stats DataFrames.
+    
+    Scoring plays are read straight from nfl_<year>.jsonl into Arrow columns,
+    one row per play. Player stats have one row per player per stat category,
+    with a stats.<LABEL> column for each stat label. Both tables are cached
+    next to the season file as nfl_<year>_scoring.parquet and
+    nfl_<year>_players.parquet and rebuilt only when the season file is newer.
+    
+    Args:
+        year: NFL season year, as passed to download_season_games
+        output_dir: Directory holding the season file
+    """
+    # Imported here so fetching and downloading don't pay for pandas and pyarrow
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.json as paj
+    
+    season_path = os.path.join(output_dir, f"nfl_{year}.jsonl")
+    scoring_path = os.path.join(output_dir, f"nfl_{year}_scoring.parquet")
+    players_path = os.path.join(output_dir, f"nfl_{year}_players.parquet")
+    
+    season_mtime = os.path.getmtime(season_path)
+    if all(os.path.exists(path) and os.path.getmtime(path) >= season_mtime
+           for path in (scoring_path, players_path)):
+        return pd.read_parquet(scoring_path), pd.read_parquet(players_path)
+    
+    # Only these columns are parsed; the rest of each line (team and player
+    # stats keyed by abbreviation) is skipped
+    scoring_schema = pa.schema([
+        ("game_id", pa.string()),
+        ("date", pa.string()),
+        ("scoring_plays", pa.list_(pa.struct([
+            ("quarter", pa.int64()),
+            ("time", pa.string()),
+            ("team", pa.string()),
+            ("description", pa.string()),
+            ("away_score", pa.int64()),
+            ("home_score", pa.int64()),
+        ]))),
+    ])
+    # A download that saved no games leaves an empty season file, which
+    # read_json rejects
+    if os.path.getsize(season_path) == 0:
+        games = scoring_schema.empty_table()
+    else:
+        games = paj.read_json(season_path, parse_options=paj.ParseOptions(
+            explicit_schema=scoring_schema, unexpected_field_behavior="ignore"))
+    plays = games.column("scoring_plays").combine_chunks()
+    game_rows = pc.list_parent_indices(plays)
+    scoring = pa.Table.from_arrays(
+        [games.column("game_id").take(game_rows), games.column("date").take(game_rows)]
+        + pc.list_flatten(plays).flatten(),
+        names=["game_id", "date"] + [field.name for field in plays.type.value_type]
+    ).to_pandas()
+    
+    rows = []
+    for game in iter_season_games(year, output_dir):
+        for team_abbr, categories in game.get("player_statistics", {}).items():
+            for category, players in categories.items():
+                for player in players:
+                    rows.append({"game_id": game.get("game_id"), "team": team_abbr,
+                                 "category": category, **player})
+    if rows:
+        players = pd.json_normalize(rows)
+    else:
+        players = pd.DataFrame(columns=["game_id", "team", "category", "name", "position"])
+    
+    scoring.to_parquet(scoring_path)
+    players.to_parquet(players_path)
+    return scoring, players
+
+
+class ETagStore:
+    """Persist the ETag and body of fetched URLs in SQLite for conditional GETs.
+    
+    Lets an expired or evicted response be revalidated with If-None-Match, so
+    an unchanged resource costs a 304 instead of a full download.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._db: Optional[aiosqlite.Connection] = None
+    
+    async def open(self) -> None:
+        self._db = await aiosqlite.connect(self.path)
+        await self._db.execute(
+            "CREATE TABLE IF NOT EXISTS etags (key TEXT PRIMARY KEY, etag TEXT NOT NULL, body BLOB NOT NULL)"
+        )
+        await self._db.commit()
+    
+    async def close(self) -> None:
+        await self._db.close()
+        self._db = None
+    
+    async def get_etag(self, key: str) -> Optional[str]:
+        """Return the stored ETag for a request key, or None."""
+        async with self._db.execute("SELECT etag FROM etags WHERE key = ?", (key,)) as cursor:
+            row = await cursor.fetchone()
+        return row[0] if row else None
+    
+    async def get_body(self, key: str) -> bytes:
+        """Return the body stored with a request key's ETag."""
+        async with self._db.execute("SELECT body FROM etags WHERE key = ?", (key,)) as cursor:
+            row = await cursor.fetchone()
+        return row[0]
+    
+    async def put(self, key: str, etag: str, body: bytes) -> None:
+        """Store the ETag and body returned for a request key."""
+        await self._db.execute("INSERT OR REPLACE INTO etags VALUES (?, ?, ?)", (key, etag, body))
+        await self._db.commit()
 
 
 class NFLDataFetcher:
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 16, cache_name: str = "espn_cache.sqlite",
+                 cache_ttl: timedelta = DEFAULT_CACHE_TTL, pool_size: int = 16):
         self.base_url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl"
         self.core_url = "https://sports.core.api.espn.com/v2/sports/football/leagues/nfl"
+        self.cache_name = cache_name
+        self.cache_ttl = cache_ttl
+        self.pool_size = pool_size
+        self.session: Optional[CachedSession] = None
+        # ETags live in their own table of the response cache database
+        self.etags = ETagStore(cache_name)
+        # Caps how many game summaries are fetched at once to respect ESPN rate limits
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        # Decoded scoreboards keyed by (year, season_type, week, keys) -> (expires_at, scoreboard)
+        self._scoreboards: OrderedDict = OrderedDict()
+        # LRU of extractor results keyed by (extractor, game_id, ...)
+        self._extract_cache: OrderedDict = OrderedDict()
+        # Extractors also run on writer threads during season downloads
+        self._extract_lock = threading.Lock()
+    
+    async def __aenter__(self):
+        # Every request shares one pool of keep-alive connections, so the TCP and
+        # TLS handshakes are paid once per connection rather than once per request
+        connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=KEEPALIVE_TIMEOUT,
+                                        ttl_dns_cache=DNS_CACHE_TTL)
+        # Responses are cached on disk keyed by URL + query params; only 200s are stored
+        self.session = CachedSession(
+            cache=SQLiteBackend(self.cache_name, expire_after=self.cache_ttl),
+            connector=connector,
+            timeout=REQUEST_TIMEOUT,
+        )
+        await self.etags.open()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+        self.session = None
+        await self.etags.close()
+    
+    async def _get_json(self, url: str, params: Optional[Dict] = None, expire_after=None,
+                        keys: Optional[Tuple[str, ...]] = None) -> Dict:
+        """Issue a GET request on the shared session and decode the JSON body.
+        
+        A stored ETag is sent as If-None-Match, which only reaches ESPN when
+        the response cache misses. A 304 reuses the body stored alongside it.
+        
+        Rate limiting, server errors and dropped connections are retried up to
+        RETRY_ATTEMPTS times.
+        
+        Args:
+            url: Endpoint URL
+            params: Optional query string parameters
+            expire_after: Cache lifetime for this response (defaults to the session TTL)
+            keys: Only decode these top-level keys of the response (decodes everything if None)
+        """
+        key = self.session.cache.create_key("GET", url, params=params)
+        # Only the ETag is read up front; the stored body is loaded on a 304
+        validator = await self.etags.get_etag(key)
+        headers = {"If-None-Match": validator} if validator else None
+        
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            delay = RETRY_BACKOFF * 2 ** (attempt - 1)
+            try:
+                async with self.session.get(url, params=params, headers=headers,
+                                            expire_after=expire_after) as response:
+                    if response.status == 304 and validator:
+                        # Unchanged since the last full download
+                        body = await self.etags.get_body(key)
+                        await self._recache(key, response, body, expire_after)
+                        etag = None
+                        break
+                    if response.status not in RETRY_STATUSES or attempt == RETRY_ATTEMPTS:
+                        response.raise_for_status()
+                        body = await response.read()
+                        etag = None if response.from_cache else response.headers.get("ETag")
+                        break
+                    delay = self._retry_after(response, delay)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == RETRY_ATTEMPTS:
+                    raise
+            # Back off outside the response so its connection goes back to the pool
+            await asyncio.sleep(delay)
+        
+        # Decode straight from bytes, skipping aiohttp's text decoding
+        try:
+            data = orjson.loads(body) if keys is None else self._decode_keys(body, keys)
+        except ValueError:  # orjson and simdjson both raise ValueError on bad JSON
+            # Don't serve a malformed body from the cache on the next run
+            await self.session.cache.delete_url(url, params=params)
+            raise
+        
+        if etag:
+            await self.etags.put(key, etag, body)
+        return data
+    
+    async def _recache(self, key: str, response: aiohttp.ClientResponse, body: bytes,
+                       expire_after=None) -> None:
+        """Put a body revalidated by a 304 back in the response cache as a 200.
+        
+        The cache only stores 200s, so without this a revalidated URL would
+        send a conditional GET on every later request instead of being served
+        from the cache for its usual lifetime.
+        
+        Args:
+            key: Cache key of the request
+            response: The 304 response
+            body: Body stored with the ETag that was revalidated
+            expire_after: Cache lifetime for this response (defaults to the session TTL)
+        """
+        cached = await CachedResponse.from_client_response(
+            response, get_expiration_datetime(self.cache_ttl if expire_after is None else expire_after)
+        )
+        cached.status = 200
+        cached.reason = "OK"
+        cached._body = body
+        await self.session.cache.responses.write(key, cached)
+    
+    def _retry_after(self, response: aiohttp.ClientResponse, default: float) -> float:
+        """Return the delay in seconds a response asks for before retrying.
+        
+        Args:
+            response: Response that will be retried
+            default: Delay to use when there is no Retry-After header in seconds
+        """
+        try:
+            return min(max(float(response.headers["Retry-After"]), 0.0), MAX_RETRY_DELAY)
+        except (KeyError, ValueError):
+            return default
+    
+    def _decode_keys(self, body: bytes, keys: Tuple[str, ...]) -> Dict:
+        """Decode only the given top-level keys of a JSON object.
         
-    def get_scoreboard(self, year: int = 2024, season_type: int = 2, week: Optional[int] = None) -> Dict:
+        simdjson indexes the whole body, but only the requested sub-trees are
+        turned into Python objects. Each call gets its own parser: a parser
+        can't be reused while any proxy into its last document is alive, and
+        an exception's traceback can keep one alive across an await.
+        
+        Args:
+            body: Raw JSON response body
+            keys: Top-level keys to decode; missing keys are left out
+        """
+        doc = simdjson.Parser().parse(body)
+        if not isinstance(doc, simdjson.Object):
+            raise ValueError("Expected a JSON object")
+        
+        decoded = {}
+        for key in keys:
+            value = doc.get(key)
+            if isinstance(value, simdjson.Object):
+                decoded[key] = value.as_dict()
+            elif isinstance(value, simdjson.Array):
+                decoded[key] = value.as_list()
+            elif key in doc:
+                decoded[key] = value
+        return decoded
+    
+    async def _cache_forever(self, url: str, params: Optional[Dict] = None) -> None:
+        """Clear the expiration of a cached response so it is never fetched again.
+        
+        Args:
+            url: Endpoint URL of the cached response
+            params: Query string parameters of the cached response
+        """
+        cache = self.session.cache
+        key = cache.create_key("GET", url, params=params)
+        response = await cache.responses.read(key)
+        if response is not None and response.expires is not None:
+            response.expires = None
+            await cache.responses.write(key, response)
+        
+    async def get_scoreboard(self, year: int = 2024, season_type: int = 2, week: Optional[int] = None,
+                             keys: Optional[Tuple[str, ...]] = None) -> Dict:
         """Get NFL scoreboard for a specific year, season type, and optionally week.
         
+        Scoreboards are also kept in memory, past seasons for the life of the
+        fetcher and the current season for CURRENT_SEASON_CACHE_TTL seconds,
+        so repeat calls skip the response cache and JSON decoding.
+        
         Args:
             year: NFL season year
             season_type: 1=preseason, 2=regular season, 3=postseason
             week: Specific week number (optional)
+            keys: Only decode these top-level scoreboard keys (e.g. SCOREBOARD_KEYS)
         """
+        memo_key = (year, season_type, week, keys)
+        memoized = self._scoreboards.get(memo_key)
+        if memoized and memoized[0] > time.monotonic():
+            return memoized[1]
+        
         url = f"{self.base_url}/scoreboard"
         params = {
             "dates": year,
@@ -26,33 +558,45 @@ class NFLDataFetcher:
         }
         if week:
             params["week"] = week
+        past_season = year < current_season()
+        expire_after = NEVER_EXPIRE if past_season else CURRENT_SEASON_CACHE_TTL
             
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching scoreboard: {e}")
+            scoreboard = await self._get_json(url, params, expire_after=expire_after, keys=keys)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            tqdm.write(f"Error fetching scoreboard: {e}")
             return {}
+        
+        expires_at = float("inf") if past_season else time.monotonic() + CURRENT_SEASON_CACHE_TTL
+        self._scoreboards[memo_key] = (expires_at, scoreboard)
+        self._scoreboards.move_to_end(memo_key)
+        if len(self._scoreboards) > SCOREBOARD_CACHE_SIZE:
+            self._scoreboards.popitem(last=False)
+        return scoreboard
     
-    def get_game_summary(self, event_id: str) -> Dict:
+    async def get_game_summary(self, event_id: str, keys: Optional[Tuple[str, ...]] = None) -> Dict:
         """Get detailed game summary including box score for a specific game.
         
         Args:
             event_id: ESPN event ID for the game
+            keys: Only decode these top-level summary keys (e.g. SUMMARY_KEYS)
         """
         url = f"{self.base_url}/summary"
         params = {"event": event_id}
         
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching game summary: {e}")
+            game_summary = await self._get_json(url, params, expire_after=LIVE_GAME_CACHE_TTL, keys=keys)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            tqdm.write(f"Error fetching game summary: {e}")
             return {}
+        
+        # Completed games are immutable, so keep their summary cached permanently
+        if dig(game_summary, "header", "competitions", 0, "status", "type", "state") == "post":
+            await self._cache_forever(url, params)
+        
+        return game_summary
     
-    def get_team_statistics(self, event_id: str, team_id: str) -> Dict:
+    async def get_team_statistics(self, event_id: str, team_id: str) -> Dict:
         """Get detailed team statistics for a specific game.
         
         Args:
@@ -62,38 +606,203 @@ class NFLDataFetcher:
         url = f"{self.core_url}/events/{event_id}/competitions/{event_id}/competitors/{team_id}/statistics"
         
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching team statistics: {e}")
+            return await self._get_json(url)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            tqdm.write(f"Error fetching team statistics: {e}")
             return {}
     
-    def get_play_by_play(self, event_id: str, limit: int = 300) -> Dict:
+    async def get_play_by_play(self, event_id: str, limit: int = 300,
+                               keys: Optional[Tuple[str, ...]] = None) -> Dict:
         """Get play-by-play data for a specific game.
         
         Args:
             event_id: ESPN event ID for the game
             limit: Maximum number of plays to retrieve
+            keys: Only decode these top-level response keys (e.g. ("items",))
         """
         url = f"{self.core_url}/events/{event_id}/competitions/{event_id}/plays"
         params = {"limit": limit}
         
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching play-by-play: {e}")
+            return await self._get_json(url, params, keys=keys)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            tqdm.write(f"Error fetching play-by-play: {e}")
             return {}
     
+    async def get_play_texts(self, event_id: str, limit: int = 300) -> List[str]:
+        """Get the display text of each play in a game, in order.
+        
+        Only the items list of the play-by-play response is decoded.
+        
+        Args:
+            event_id: ESPN event ID for the game
+            limit: Maximum number of plays to retrieve
+        """
+        plays_data = await self.get_play_by_play(event_id, limit, keys=("items",))
+        plays = plays_data.get("items", [])
+        if not plays:
+            return []
+        
+        extract = play_text_extractor(plays[0])
+        try:
+            return [extract(play) for play in plays]
+        except (KeyError, TypeError):
+            # Mixed schemas; fall back to checking every play
+            return [play_text(play) for play in plays]
+    
+    def _memoize_extract(self, key: tuple, extract: Callable, *args) -> Dict:
+        """Return the cached result for key, calling extract(*args) on a miss.
+        
+        Args:
+            key: Cache key; its second element is the game ID, and nothing is cached without one
+            extract: Extractor to run on a cache miss
+            args: Arguments passed to the extractor
+        """
+        if not key[1]:
+            return extract(*args)
+        
+        with self._extract_lock:
+            if key in self._extract_cache:
+                self._extract_cache.move_to_end(key)
+                return self._extract_cache[key]
+        
+        result = extract(*args)
+        with self._extract_lock:
+            self._extract_cache[key] = result
+            if len(self._extract_cache) > EXTRACT_CACHE_SIZE:
+                self._extract_cache.popitem(last=False)
+        return result
+    
+    def _walk_team_stats(self, boxscore: Dict):
+        """Yield (team_abbr, stats) for each team in a boxscore.
+        
+        team_abbr is None when ESPN omits the abbreviation; stats maps stat
+        labels to display values.
+        """
+        for team_data in boxscore.get("teams", []):
+            # Team statistics are stored as individual stat objects
+            stats = {}
+            for stat in team_data.get("statistics", []):
+                stat_label = stat.get("label", stat.get("name", ""))
+                stats[stat_label] = stat.get("displayValue", stat.get("value", ""))
+            yield dig(team_data, "team", "abbreviation"), stats
+    
+    def _walk_players(self, boxscore: Dict):
+        """Yield (team_abbr, categories) for each team's players in a boxscore.
+        
+        categories is a list of (category_name, stat_labels, athletes), where
+        athletes is a list of (name, position, stats) in ESPN's order.
+        """
+        for team_players in boxscore.get("players", []):
+            categories = []
+            for stat_category in team_players.get("statistics", []):
+                stat_labels = stat_category.get("labels") or stat_category.get("keys") or []
+                athletes = [
+                    (
+                        dig(athlete, "athlete", "displayName") or "",
+                        dig(athlete, "athlete", "position", "abbreviation") or "",
+                        athlete.get("stats", [])
+                    )
+                    for athlete in stat_category.get("athletes", [])
+                ]
+                categories.append((stat_category.get("name", ""), stat_labels, athletes))
+            yield dig(team_players, "team", "abbreviation") or "", categories
+    
+    def _walk_scoring(self, game_summary: Dict):
+        """Yield (quarter, clock, team, description, away_score, home_score) for each scoring play."""
+        for play in game_summary.get("scoringPlays", []):
+            yield (
+                dig(play, "period", "number") or 0,
+                dig(play, "clock", "displayValue") or "",
+                dig(play, "team", "abbreviation") or "",
+                play.get("text", ""),
+                play.get("awayScore", 0),
+                play.get("homeScore", 0)
+            )
+    
+    def _parse_summary(self, game_summary: Dict) -> Dict:
+        """Walk the boxscore and scoring plays of a game summary once.
+        
+        Both extractors build their output from this result, which is cached on
+        game_summary["_parsed"] so the second extractor reuses it.
+        
+        Args:
+            game_summary: Full game summary from ESPN API
+        """
+        parsed = game_summary.get("_parsed")
+        if parsed is None:
+            boxscore = game_summary.get("boxscore", {})
+            parsed = game_summary["_parsed"] = {
+                "team_stats": list(self._walk_team_stats(boxscore)),
+                "players": list(self._walk_players(boxscore)),
+                "scoring": list(self._walk_scoring(game_summary))
+            }
+        return parsed
+    
     def extract_clean_game_data(self, game_summary: Dict, event_data: Dict = None) -> Dict:
         """Extract only essential game data for a clean JSON output.
         
+        Results are memoized per game ID, so repeat calls are a dict lookup.
+        
         Args:
             game_summary: Full game summary from ESPN API
             event_data: Optional event data for additional game info
         """
+        game_id = (event_data or game_summary.get("header", {})).get("id")
+        key = ("clean", game_id, event_data is not None)
+        return self._memoize_extract(key, self._extract_clean_game_data, game_summary, event_data)
+    
+    def _extract_from_event(self, event_data: Dict, clean_data: Dict) -> None:
+        """Fill in game ID, date, status, venue, teams and scores from a scoreboard event.
+        
+        Args:
+            event_data: Scoreboard event for the game
+            clean_data: Clean game data to update in place
+        """
+        clean_data["game_id"] = event_data.get("id", "")
+        clean_data["date"] = event_data.get("date", "")
+        clean_data["status"] = dig(event_data, "status", "type", "description") or ""
+        
+        competition = dig(event_data, "competitions", 0)
+        if not competition:
+            return
+        clean_data["venue"] = dig(competition, "venue", "fullName") or ""
+        clean_data["attendance"] = competition.get("attendance", 0)
+        
+        for competitor in competition.get("competitors", []):
+            team_abbr = dig(competitor, "team", "abbreviation") or ""
+            clean_data["teams"][team_abbr] = {
+                "name": dig(competitor, "team", "displayName") or "",
+                "home_away": competitor.get("homeAway", ""),
+                "record": dig(competitor, "records", 0, "summary") or ""
+            }
+            clean_data["final_score"][team_abbr] = score_int(competitor.get("score"))
+    
+    def _extract_from_header(self, game_summary: Dict, clean_data: Dict) -> None:
+        """Fill in date, status, venue, teams and scores from a game summary header.
+        
+        Args:
+            game_summary: Full game summary from ESPN API
+            clean_data: Clean game data to update in place
+        """
+        competition = dig(game_summary, "header", "competitions", 0)
+        if not competition:
+            return
+        clean_data["date"] = competition.get("date", "")
+        clean_data["status"] = dig(competition, "status", "type", "description") or ""
+        clean_data["venue"] = dig(competition, "venue", "fullName") or ""
+        clean_data["attendance"] = competition.get("attendance", 0)
+        
+        for competitor in competition.get("competitors", []):
+            team_abbr = dig(competitor, "team", "abbreviation") or ""
+            clean_data["teams"][team_abbr] = {
+                "name": dig(competitor, "team", "displayName") or "",
+                "home_away": competitor.get("homeAway", ""),
+                "record": ""
+            }
+            clean_data["final_score"][team_abbr] = score_int(competitor.get("score"))
+    
+    def _extract_clean_game_data(self, game_summary: Dict, event_data: Dict = None) -> Dict:
         clean_data = {
             "game_id": "",
             "date": "",
@@ -108,131 +817,63 @@ class NFLDataFetcher:
         }
         
         try:
-            # Extract game ID and basic info from event data if provided
+            # Basic info comes from the scoreboard event when the caller has it
+            # (season downloads always do), otherwise from the summary header
             if event_data:
-                clean_data["game_id"] = event_data.get("id", "")
-                clean_data["date"] = event_data.get("date", "")
-                clean_data["status"] = event_data.get("status", {}).get("type", {}).get("description", "")
-                
-                # Get teams and scores from event data
-                if "competitions" in event_data and event_data["competitions"]:
-                    competition = event_data["competitions"][0]
-                    clean_data["venue"] = competition.get("venue", {}).get("fullName", "")
-                    clean_data["attendance"] = competition.get("attendance", 0)
-                    
-                    if "competitors" in competition:
-                        for competitor in competition["competitors"]:
-                            team_abbr = competitor.get("team", {}).get("abbreviation", "")
-                            clean_data["teams"][team_abbr] = {
-                                "name": competitor.get("team", {}).get("displayName", ""),
-                                "home_away": competitor.get("homeAway", ""),
-                                "record": competitor.get("records", [{}])[0].get("summary", "") if competitor.get("records") else ""
-                            }
-                            clean_data["final_score"][team_abbr] = int(competitor.get("score", 0))
+                self._extract_from_event(event_data, clean_data)
+            else:
+                self._extract_from_header(game_summary, clean_data)
             
-            # Get additional info from game summary header if not in event data
-            if "header" in game_summary and not event_data:
-                header = game_summary["header"]
-                if "competitions" in header and header["competitions"]:
-                    competition = header["competitions"][0]
-                    clean_data["date"] = competition.get("date", "")
-                    clean_data["status"] = competition.get("status", {}).get("type", {}).get("description", "")
-                    clean_data["venue"] = competition.get("venue", {}).get("fullName", "")
-                    clean_data["attendance"] = competition.get("attendance", 0)
-                    
-                    if "competitors" in competition:
-                        for competitor in competition["competitors"]:
-                            team_abbr = competitor.get("team", {}).get("abbreviation", "")
-                            clean_data["teams"][team_abbr] = {
-                                "name": competitor.get("team", {}).get("displayName", ""),
-                                "home_away": competitor.get("homeAway", ""),
-                                "record": ""
-                            }
-                            clean_data["final_score"][team_abbr] = int(competitor.get("score", 0))
+            parsed = self._parse_summary(game_summary)
             
             # Extract team statistics from boxscore
-            if "boxscore" in game_summary and "teams" in game_summary["boxscore"]:
-                for team_data in game_summary["boxscore"]["teams"]:
-                    team_abbr = team_data.get("team", {}).get("abbreviation", "")
-                    if team_abbr:
-                        stats = {}
-                        for stat in team_data.get("statistics", []):
-                            stat_label = stat.get("label", stat.get("name", ""))
-                            stat_value = stat.get("displayValue", stat.get("value", ""))
-                            stats[stat_label] = stat_value
-                        clean_data["team_statistics"][team_abbr] = stats
+            for team_abbr, stats in parsed["team_stats"]:
+                if team_abbr:
+                    clean_data["team_statistics"][team_abbr] = stats
             
             # Extract scoring plays
-            if "scoringPlays" in game_summary:
-                for play in game_summary["scoringPlays"]:
-                    clean_play = {
-                        "quarter": play.get("period", {}).get("number", 0),
-                        "time": play.get("clock", {}).get("displayValue", ""),
-                        "team": play.get("team", {}).get("abbreviation", ""),
-                        "description": play.get("text", ""),
-                        "away_score": play.get("awayScore", 0),
-                        "home_score": play.get("homeScore", 0)
-                    }
-                    clean_data["scoring_plays"].append(clean_play)
+            append_play = clean_data["scoring_plays"].append
+            for quarter, clock, team, description, away_score, home_score in parsed["scoring"]:
+                append_play({
+                    "quarter": quarter,
+                    "time": clock,
+                    "team": team,
+                    "description": description,
+                    "away_score": away_score,
+                    "home_score": home_score
+                })
             
             # Extract key player statistics with proper labels
-            if "boxscore" in game_summary and "players" in game_summary["boxscore"]:
-                for team_players in game_summary["boxscore"]["players"]:
-                    team_abbr = team_players.get("team", {}).get("abbreviation", "")
-                    if team_abbr:
-                        clean_data["player_statistics"][team_abbr] = {}
+            for team_abbr, categories in parsed["players"]:
+                if team_abbr:
+                    clean_data["player_statistics"][team_abbr] = {}
+                    
+                    # Only get key categories: passing, rushing, receiving, defensive
+                    for category_name, stat_labels, athletes in categories:
+                        category = category_name.lower()
+                        if category not in KEY_CATEGORIES:
+                            continue
+                        fallback_labels = FALLBACK_LABELS.get(category)
                         
-                        # Only get key categories: passing, rushing, receiving
-                        key_categories = ["passing", "rushing", "receiving", "defensive"]
-                        for stat_category in team_players.get("statistics", []):
-                            category_name = stat_category.get("name", "")
-                            if category_name.lower() in key_categories:
-                                # Get stat labels from the first entry
-                                stat_labels = []
-                                if stat_category.get("labels"):
-                                    stat_labels = stat_category["labels"]
-                                elif stat_category.get("keys"):
-                                    stat_labels = stat_category["keys"]
-                                
-                                players = []
-                                for athlete in stat_category.get("athletes", [])[:3]:  # Top 3 players per category
-                                    player_stats = {}
-                                    stats_array = athlete.get("stats", [])
-                                    
-                                    # Map stats to their labels
-                                    if stat_labels and len(stat_labels) == len(stats_array):
-                                        for label, value in zip(stat_labels, stats_array):
-                                            player_stats[label] = value
-                                    else:
-                                        # Fallback: use common stat mappings based on category
-                                        if category_name.lower() == "passing":
-                                            passing_labels = ["C/ATT", "YDS", "AVG", "TD", "INT", "SACKS", "QBR", "RTG"]
-                                            for i, value in enumerate(stats_array[:len(passing_labels)]):
-                                                if i < len(passing_labels):
-                                                    player_stats[passing_labels[i]] = value
-                                        elif category_name.lower() == "rushing":
-                                            rushing_labels = ["CAR", "YDS", "AVG", "TD", "LONG"]
-                                            for i, value in enumerate(stats_array[:len(rushing_labels)]):
-                                                if i < len(rushing_labels):
-                                                    player_stats[rushing_labels[i]] = value
-                                        elif category_name.lower() == "receiving":
-                                            receiving_labels = ["REC", "YDS", "AVG", "TD", "LONG", "TGTS"]
-                                            for i, value in enumerate(stats_array[:len(receiving_labels)]):
-                                                if i < len(receiving_labels):
-                                                    player_stats[receiving_labels[i]] = value
-                                        else:
-                                            # Generic fallback
-                                            for i, value in enumerate(stats_array):
-                                                player_stats[f"stat_{i+1}"] = value
-                                    
-                                    player = {
-                                        "name": athlete.get("athlete", {}).get("displayName", ""),
-                                        "position": athlete.get("athlete", {}).get("position", {}).get("abbreviation", ""),
-                                        "stats": player_stats if player_stats else athlete.get("stats", [])
-                                    }
-                                    players.append(player)
-                                if players:
-                                    clean_data["player_statistics"][team_abbr][category_name] = players
+                        players = []
+                        for name, position, stats_array in athletes[:3]:  # Top 3 players per category
+                            # Map stats to their labels
+                            if stat_labels and len(stat_labels) == len(stats_array):
+                                player_stats = dict(zip(stat_labels, stats_array))
+                            elif fallback_labels:
+                                # Fallback: use common stat mappings based on category
+                                player_stats = dict(zip(fallback_labels, stats_array))
+                            else:
+                                # Generic fallback
+                                player_stats = {f"stat_{i+1}": value for i, value in enumerate(stats_array)}
+                            
+                            players.append({
+                                "name": name,
+                                "position": position,
+                                "stats": player_stats if player_stats else stats_array
+                            })
+                        if players:
+                            clean_data["player_statistics"][team_abbr][category_name] = players
             
         except Exception as e:
             print(f"Error extracting clean game data: {e}")
@@ -242,9 +883,15 @@ class NFLDataFetcher:
     def extract_box_score_data(self, game_summary: Dict) -> Dict:
         """Extract and format box score data from game summary.
         
+        Results are memoized per game ID, so repeat calls are a dict lookup.
+        
         Args:
             game_summary: Game summary data from ESPN API
         """
+        key = ("box_score", dig(game_summary, "header", "id"))
+        return self._memoize_extract(key, self._extract_box_score_data, game_summary)
+    
+    def _extract_box_score_data(self, game_summary: Dict) -> Dict:
         box_score = {
             "game_info": {},
             "team_stats": {},
@@ -260,86 +907,247 @@ class NFLDataFetcher:
                     competition = header["competitions"][0]
                     box_score["game_info"] = {
                         "date": competition.get("date", ""),
-                        "status": competition.get("status", {}).get("type", {}).get("description", ""),
-                        "venue": competition.get("venue", {}).get("fullName", ""),
+                        "status": dig(competition, "status", "type", "description") or "",
+                        "venue": dig(competition, "venue", "fullName") or "",
                         "attendance": competition.get("attendance", 0)
                     }
                     
                     # Extract team scores
                     if "competitors" in competition:
                         for team in competition["competitors"]:
-                            team_name = team.get("team", {}).get("abbreviation", "")
+                            team_name = dig(team, "team", "abbreviation") or ""
                             box_score["team_stats"][team_name] = {
                                 "score": team.get("score", 0),
                                 "home_away": team.get("homeAway", ""),
                                 "record": team.get("record", [])
                             }
             
-            # Extract detailed box score stats
-            if "boxscore" in game_summary:
-                boxscore = game_summary["boxscore"]
+            parsed = self._parse_summary(game_summary)
+            
+            # Team statistics
+            for idx, (team_name, stats_dict) in enumerate(parsed["team_stats"]):
+                if team_name is None:
+                    team_name = f"Team{idx+1}"
                 
-                # Team statistics
-                if "teams" in boxscore:
-                    for idx, team_data in enumerate(boxscore["teams"]):
-                        team_stats = team_data.get("statistics", [])
-                        team_name = team_data.get("team", {}).get("abbreviation", f"Team{idx+1}")
-                        
-                        if team_name not in box_score["team_stats"]:
-                            box_score["team_stats"][team_name] = {}
-                        
-                        # Parse team statistics - they're stored as individual stat objects
-                        stats_dict = {}
-                        for stat in team_stats:
-                            stat_name = stat.get("name", "")
-                            stat_value = stat.get("displayValue", stat.get("value", ""))
-                            stat_label = stat.get("label", stat_name)
-                            stats_dict[stat_label] = stat_value
-                        
-                        box_score["team_stats"][team_name]["statistics"] = stats_dict
+                if team_name not in box_score["team_stats"]:
+                    box_score["team_stats"][team_name] = {}
                 
-                # Player statistics
-                if "players" in boxscore:
-                    for team_players in boxscore["players"]:
-                        team_name = team_players.get("team", {}).get("abbreviation", "")
-                        box_score["player_stats"][team_name] = {}
-                        
-                        for stat_category in team_players.get("statistics", []):
-                            category_name = stat_category.get("name", "")
-                            box_score["player_stats"][team_name][category_name] = []
-                            
-                            for athlete in stat_category.get("athletes", []):
-                                player_data = {
-                                    "name": athlete.get("athlete", {}).get("displayName", ""),
-                                    "position": athlete.get("athlete", {}).get("position", {}).get("abbreviation", ""),
-                                    "stats": athlete.get("stats", [])
-                                }
-                                box_score["player_stats"][team_name][category_name].append(player_data)
+                box_score["team_stats"][team_name]["statistics"] = stats_dict
+            
+            # Player statistics
+            for team_name, categories in parsed["players"]:
+                box_score["player_stats"][team_name] = {
+                    category_name: [
+                        {"name": name, "position": position, "stats": stats}
+                        for name, position, stats in athletes
+                    ]
+                    for category_name, _, athletes in categories
+                }
             
             # Extract scoring plays
-            if "scoringPlays" in game_summary:
-                for play in game_summary["scoringPlays"]:
-                    scoring_play = {
-                        "quarter": play.get("period", {}).get("number", 0),
-                        "time": play.get("clock", {}).get("displayValue", ""),
-                        "team": play.get("team", {}).get("abbreviation", ""),
-                        "description": play.get("text", ""),
-                        "score_home": play.get("homeScore", 0),
-                        "score_away": play.get("awayScore", 0)
-                    }
-                    box_score["scoring"].append(scoring_play)
+            append_play = box_score["scoring"].append
+            for quarter, clock, team, description, away_score, home_score in parsed["scoring"]:
+                append_play({
+                    "quarter": quarter,
+                    "time": clock,
+                    "team": team,
+                    "description": description,
+                    "score_home": home_score,
+                    "score_away": away_score
+                })
             
         except Exception as e:
             print(f"Error extracting box score data: {e}")
         
         return box_score
     
-    def download_season_games(self, year: int = 2023, output_dir: str = "nflgames") -> None:
-        """Download all games from an NFL season and save to individual JSON files.
+    def _matchup(self, event: Dict) -> str:
+        """Build an "AWAY @ HOME" label for a scoreboard event.
+        
+        Args:
+            event: Scoreboard event for the game
+        """
+        away_team = ""
+        home_team = ""
+        if "competitions" in event and event["competitions"]:
+            competitors = event["competitions"][0].get("competitors", [])
+            if len(competitors) >= 2:
+                # ESPN lists teams, need to check homeAway field
+                for competitor in competitors:
+                    if competitor.get("homeAway") == "home":
+                        home_team = competitor["team"]["abbreviation"]
+                    else:
+                        away_team = competitor["team"]["abbreviation"]
+        
+        return f"{away_team} @ {home_team}"
+    
+    async def _fetch_game(self, event: Dict, matchup: str, week: int, queue: asyncio.Queue,
+                          progress: tqdm, failed_games: List[str]) -> None:
+        """Fetch a single game summary and hand it to the writers via the queue.
+        
+        Args:
+            event: Scoreboard event for the game
+            matchup: "AWAY @ HOME" label for error output
+            week: Week number the game belongs to (used for failure reporting)
+            queue: Queue of (game_summary, event, matchup, week) for the writers
+            progress: Progress bar, advanced here only when the game fails
+            failed_games: List collecting descriptions of games that failed
+        """
+        try:
+            # Fetch game summary, holding a semaphore slot so only a bounded
+            # number of requests are in flight at once
+            async with self.semaphore:
+                # The extractors only read a few top-level keys, so skip decoding the rest
+                game_summary = await self.get_game_summary(event["id"], keys=SUMMARY_KEYS)
+                # Small delay to be respectful to the API
+                await asyncio.sleep(0.5)
+            
+            if game_summary:
+                await queue.put((game_summary, event, matchup, week))
+                return
+            
+            tqdm.write(f"    ✗ {matchup} - Failed to fetch data")
+            failed_games.append(f"{matchup} (Week {week})")
+        
+        except Exception as e:
+            tqdm.write(f"    ✗ Error: {e}")
+            failed_games.append(f"Game ID {event.get('id', 'unknown')} (Week {week})")
+        
+        progress.update(1)
+    
+    async def _fetch_season(self, year: int, season_structure: List[Dict], season: SeasonWriter,
+                            queue: asyncio.Queue, num_writers: int, progress: tqdm,
+                            failed_games: List[str]) -> None:
+        """Fetch every game of a season, queueing summaries for the writers.
+        
+        Scoreboards for every week of the season are fetched concurrently up
+        front, which sizes the progress bar; then each week's game summaries are
+        fetched concurrently as well. Games already saved to the season file are
+        skipped before any summary is requested. One None sentinel per writer is
+        queued when fetching finishes.
+        
+        Args:
+            year: NFL season year
+            season_structure: Season types to fetch with their week counts and names
+            season: Season file the games are saved to
+            queue: Queue the fetched games are put on
+            num_writers: Number of writers consuming the queue
+            progress: Progress bar advanced once per finished game
+            failed_games: List collecting descriptions of games and weeks that failed
+        """
+        try:
+            # Get the scoreboards for every week of every season type in parallel
+            all_weeks = [
+                (season_info, week)
+                for season_info in season_structure
+                for week in range(1, season_info["weeks"] + 1)
+            ]
+            scoreboards = await asyncio.gather(
+                *(self.get_scoreboard(year=year, season_type=season_info["type"], week=week, keys=SCOREBOARD_KEYS)
+                  for season_info, week in all_weeks)
+            )
+            
+            # Only request summaries for games that aren't saved yet
+            pending_weeks = []
+            already_saved = 0
+            for (season_info, week), scoreboard in zip(all_weeks, scoreboards):
+                # get_scoreboard returns {} when the fetch failed
+                if not scoreboard:
+                    tqdm.write(f"  ✗ {season_info['name']} week {week} - scoreboard fetch failed")
+                    failed_games.append(f"{season_info['name']} Week {week} (scoreboard fetch failed)")
+                    continue
+                if not scoreboard.get("events"):
+                    tqdm.write(f"  No games found for {season_info['name']} week {week}")
+                    continue
+                
+                pending = []
+                for event in scoreboard["events"]:
+                    try:
+                        matchup = self._matchup(event)
+                    except Exception as e:
+                        tqdm.write(f"    ✗ Error: {e}")
+                        failed_games.append(f"Game ID {event.get('id', 'unknown')} (Week {week})")
+                        continue
+                    
+                    if event.get("id") in season:
+                        already_saved += 1
+                    else:
+                        pending.append((event, matchup))
+                
+                if pending:
+                    pending_weeks.append((season_info["name"], week, pending))
+            
+            if already_saved:
+                tqdm.write(f"Skipping {already_saved} games already downloaded")
+            progress.total = sum(len(pending) for _, _, pending in pending_weeks)
+            progress.refresh()
+            
+            for season_name, week, pending in pending_weeks:
+                progress.set_description(f"{season_name} W{week}")
+                await asyncio.gather(
+                    *(self._fetch_game(event, matchup, week, queue, progress, failed_games)
+                      for event, matchup in pending)
+                )
+        finally:
+            for _ in range(num_writers):
+                await queue.put(None)
+    
+    def _write_game(self, game_summary: Dict, event: Dict, season: SeasonWriter) -> None:
+        """Extract clean data from a game summary and append it to the season file.
+        
+        Args:
+            game_summary: Full game summary from ESPN API
+            event: Scoreboard event for the game
+            season: Season file to append the game to
+        """
+        clean_game_data = self.extract_clean_game_data(game_summary, event)
+        season.append(event["id"], clean_game_data)
+    
+    async def _save_games(self, queue: asyncio.Queue, pool: ThreadPoolExecutor, season: SeasonWriter,
+                          progress: tqdm, failed_games: List[str]) -> int:
+        """Write games from the queue in the thread pool until a None sentinel arrives.
+        
+        Extraction and disk writes run off the event loop so they overlap with
+        the network fetches still in flight.
+        
+        Args:
+            queue: Queue of fetched games
+            pool: Thread pool that runs the extraction and file writes
+            season: Season file the games are saved to
+            progress: Progress bar advanced once per finished game
+            failed_games: List collecting descriptions of games that failed
+        
+        Returns:
+            Number of games saved
+        """
+        loop = asyncio.get_running_loop()
+        saved = 0
+        
+        while True:
+            item = await queue.get()
+            if item is None:
+                return saved
+            
+            game_summary, event, matchup, week = item
+            try:
+                await loop.run_in_executor(pool, self._write_game, game_summary, event, season)
+                saved += 1
+            except Exception as e:
+                tqdm.write(f"    ✗ {matchup} - Error: {e}")
+                failed_games.append(f"{matchup} (Week {week})")
+            progress.update(1)
+    
+    async def download_season_games(self, year: int = 2023, output_dir: str = "nflgames") -> None:
+        """Download all games from an NFL season and save them to one JSONL file.
+        
+        Games are appended to <output_dir>/nfl_<year>.jsonl, one per line, with
+        an nfl_<year>.index.json file mapping game IDs to line offsets. A
+        producer fetches game summaries while a pool of writer threads extracts
+        and saves the games already fetched.
         
         Args:
             year: NFL season year (default 2023 for last complete season)
-            output_dir: Directory to save game files
+            output_dir: Directory to save the season file
         """
         # Create output directory if it doesn't exist
         if not os.path.exists(output_dir):
@@ -349,7 +1157,6 @@ class NFLDataFetcher:
         print(f"\nDownloading all games from {year} NFL season...")
         print("="*60)
         
-        total_games_downloaded = 0
         failed_games = []
         
         # NFL season structure:
@@ -366,104 +1173,29 @@ class NFLDataFetcher:
         # Quick test mode - uncomment to test with just week 1
         # season_structure = [{"type": 2, "weeks": 1, "name": "Regular Season (Test)"}]
         
-        for season_info in season_structure:
-            season_type = season_info["type"]
-            num_weeks = season_info["weeks"]
-            season_name = season_info["name"]
-            
-            print(f"\n{season_name}:")
-            print("-"*40)
-            
-            for week in range(1, num_weeks + 1):
-                print(f"\nWeek {week}:")
-                
-                # Get scoreboard for this week
-                scoreboard = self.get_scoreboard(year=year, season_type=season_type, week=week)
-                
-                if not scoreboard or "events" not in scoreboard:
-                    print(f"  No games found for week {week}")
-                    continue
-                
-                events = scoreboard["events"]
-                print(f"  Found {len(events)} games")
-                
-                for event in events:
-                    try:
-                        # Extract game info for filename
-                        event_id = event["id"]
-                        game_date = event.get("date", "")
-                        
-                        # Parse date for filename
-                        date_str = "unknown_date"
-                        if game_date:
-                            try:
-                                dt = datetime.fromisoformat(game_date.replace('Z', '+00:00'))
-                                date_str = dt.strftime("%Y%m%d")
-                            except (ValueError, AttributeError):
-                                date_str = game_date[:10].replace("-", "")
-                        
-                        # Get team abbreviations
-                        away_team = ""
-                        home_team = ""
-                        if "competitions" in event and event["competitions"]:
-                            competitors = event["competitions"][0].get("competitors", [])
-                            if len(competitors) >= 2:
-                                # ESPN lists teams, need to check homeAway field
-                                for competitor in competitors:
-                                    if competitor.get("homeAway") == "home":
-                                        home_team = competitor["team"]["abbreviation"]
-                                    else:
-                                        away_team = competitor["team"]["abbreviation"]
-                        
-                        # Create filename: YYYYMMDD_AWAY_at_HOME.json
-                        filename = f"{date_str}_{away_team}_at_{home_team}.json"
-                        filepath = os.path.join(output_dir, filename)
-                        
-                        # Skip if file already exists
-                        if os.path.exists(filepath):
-                            print(f"    ✓ {away_team} @ {home_team} - Already downloaded")
-                            continue
-                        
-                        # Fetch game summary
-                        print(f"    Downloading: {away_team} @ {home_team}...", end="")
-                        game_summary = self.get_game_summary(event_id)
-                        
-                        if game_summary:
-                            # Extract clean data
-                            clean_game_data = self.extract_clean_game_data(game_summary, event)
-                            
-                            # Save to file
-                            with open(filepath, "w") as f:
-                                json.dump(clean_game_data, f, indent=2)
-                            
-                            print(f" ✓ Saved as {filename}")
-                            total_games_downloaded += 1
-                            
-                            # Small delay to be respectful to the API
-                            time.sleep(0.5)
-                        else:
-                            print(" ✗ Failed to fetch data")
-                            failed_games.append(f"{away_team} @ {home_team} (Week {week})")
-                    
-                    except Exception as e:
-                        print(f" ✗ Error: {e}")
-                        failed_games.append(f"Game ID {event.get('id', 'unknown')} (Week {week})")
+        season_path = os.path.join(output_dir, f"nfl_{year}.jsonl")
+        queue = asyncio.Queue(maxsize=32)
+        with SeasonWriter(season_path) as season, ThreadPoolExecutor(max_workers=WRITER_THREADS) as pool, \
+                tqdm(desc="Scoreboards", unit="game") as progress:
+            results = await asyncio.gather(
+                self._fetch_season(year, season_structure, season, queue, WRITER_THREADS, progress, failed_games),
+                *(self._save_games(queue, pool, season, progress, failed_games) for _ in range(WRITER_THREADS))
+            )
+        total_games_downloaded = sum(results[1:])
         
         # Print summary
         print("\n" + "="*60)
         print("DOWNLOAD COMPLETE")
         print("="*60)
         print(f"Total games downloaded: {total_games_downloaded}")
-        print(f"Files saved to: {output_dir}/")
+        print(f"Games saved to: {season_path}")
         
         if failed_games:
-            print(f"\nFailed to download {len(failed_games)} games:")
+            print(f"\nFailed to download {len(failed_games)} games or weeks:")
             for game in failed_games:
                 print(f"  - {game}")
         
-        # List all files in directory
-        files = sorted([f for f in os.listdir(output_dir) if f.endswith('.json')])
-        print(f"\nTotal files in directory: {len(files)}")
+        print(f"\nTotal games in season file: {len(season)}")
     
     def print_formatted_box_score(self, box_score: Dict):
         """Print a nicely formatted box score.
@@ -504,12 +1236,14 @@ class NFLDataFetcher:
                 # Get all stat names
                 all_stats = set(stats1.keys()) | set(stats2.keys())
                 
-                print(f"\n{'Stat':<30} {team1:>10} {team2:>10}")
-                print("-" * 52)
-                for stat_name in sorted(all_stats):
-                    val1 = stats1.get(stat_name, "-")
-                    val2 = stats2.get(stat_name, "-")
-                    print(f"{stat_name:<30} {str(val1):>10} {str(val2):>10}")
+                # Build the whole table and write it at once instead of a print per stat
+                row = "{:<30} {:>10} {:>10}\n".format
+                lines = [f"\n{row('Stat', team1, team2)}", "-" * 52 + "\n"]
+                lines += [
+                    row(stat_name, str(stats1.get(stat_name, "-")), str(stats2.get(stat_name, "-")))
+                    for stat_name in sorted(all_stats)
+                ]
+                sys.stdout.write("".join(lines))
         
         # Scoring plays
         if box_score["scoring"]:
@@ -533,109 +1267,98 @@ class NFLDataFetcher:
                         break  # Just show first player per category for brevity
 
 
-def main():
+async def main():
     # Initialize the NFL data fetcher
-    fetcher = NFLDataFetcher()
+    async with NFLDataFetcher() as fetcher:
+        print("NFL Data Fetcher - Using ESPN's Public API")
+        print("="*50)
     
-    print("NFL Data Fetcher - Using ESPN's Public API")
-    print("="*50)
-    
-    # Check if user wants to download full season or just examples
-    import sys
-    if len(sys.argv) > 1 and sys.argv[1] == "download-season":
-        # Download full season mode
-        year = 2023  # Last complete season
-        if len(sys.argv) > 2:
-            try:
-                year = int(sys.argv[2])
-            except ValueError:
-                print(f"Invalid year: {sys.argv[2]}, using 2023")
+        # Check if user wants to download full season or just examples
+        if len(sys.argv) > 1 and sys.argv[1] == "download-season":
+            # Download full season mode
+            year = 2023  # Last complete season
+            if len(sys.argv) > 2:
+                try:
+                    year = int(sys.argv[2])
+                except ValueError:
+                    print(f"Invalid year: {sys.argv[2]}, using 2023")
         
-        fetcher.download_season_games(year=year)
-        return
+            await fetcher.download_season_games(year=year)
+            return
     
-    # Default mode: Show examples
-    print("\n1. Fetching recent NFL games from 2024 season...")
-    scoreboard = fetcher.get_scoreboard(year=2024, season_type=2, week=1)
+        # Default mode: Show examples
+        print("\n1. Fetching recent NFL games from 2024 season...")
+        # The 2023 Week 10 fallback is fetched alongside, so a miss costs no extra round trip
+        scoreboard, fallback_scoreboard = await asyncio.gather(
+            fetcher.get_scoreboard(year=2024, season_type=2, week=1, keys=SCOREBOARD_KEYS),
+            fetcher.get_scoreboard(year=2023, season_type=2, week=10, keys=SCOREBOARD_KEYS)
+        )
     
-    if scoreboard and "events" in scoreboard:
-        events = scoreboard["events"]
-        print(f"Found {len(events)} games")
+        if scoreboard and "events" in scoreboard:
+            events = scoreboard["events"]
+            print(f"Found {len(events)} games")
         
-        # Show first few games
-        for i, event in enumerate(events[:3], 1):
-            print(f"\nGame {i}:")
-            competitors = event.get("competitions", [{}])[0].get("competitors", [])
-            if len(competitors) >= 2:
-                away_team = competitors[0]["team"]["abbreviation"]
-                home_team = competitors[1]["team"]["abbreviation"]
-                away_score = competitors[0].get("score", "0")
-                home_score = competitors[1].get("score", "0")
-                event_id = event["id"]
-                print(f"  {away_team} @ {home_team}: {away_score}-{home_score}")
-                print(f"  Event ID: {event_id}")
-                print(f"  Date: {event.get('date', 'N/A')}")
-                print(f"  Status: {event.get('status', {}).get('type', {}).get('description', 'N/A')}")
-        
-        # Example 2: Get detailed box score for the first game
-        if events:
-            print("\n" + "="*50)
-            print("2. Fetching detailed box score for the first game...")
-            first_event = events[0]
-            first_event_id = first_event["id"]
+            # Show first few games
+            for i, event in enumerate(events[:3], 1):
+                print(f"\nGame {i}:")
+                competitors = event.get("competitions", [{}])[0].get("competitors", [])
+                if len(competitors) >= 2:
+                    away_team = competitors[0]["team"]["abbreviation"]
+                    home_team = competitors[1]["team"]["abbreviation"]
+                    away_score = competitors[0].get("score", "0")
+                    home_score = competitors[1].get("score", "0")
+                    event_id = event["id"]
+                    print(f"  {away_team} @ {home_team}: {away_score}-{home_score}")
+                    print(f"  Event ID: {event_id}")
+                    print(f"  Date: {event.get('date', 'N/A')}")
+                    print(f"  Status: {event.get('status', {}).get('type', {}).get('description', 'N/A')}")
+        
+            # Example 2: Get detailed box score for the first game
+            if events:
+                print("\n" + "="*50)
+                print("2. Fetching detailed box score for the first game...")
+                first_event = events[0]
+                first_event_id = first_event["id"]
             
-            # Get game summary with box score
-            game_summary = fetcher.get_game_summary(first_event_id)
+                # Get game summary with box score
+                game_summary = await fetcher.get_game_summary(first_event_id)
             
-            if game_summary:
-                # Extract and print formatted box score
-                box_score = fetcher.extract_box_score_data(game_summary)
-                fetcher.print_formatted_box_score(box_score)
+                if game_summary:
+                    # Extract and print formatted box score
+                    box_score = fetcher.extract_box_score_data(game_summary)
+                    fetcher.print_formatted_box_score(box_score)
                 
-                # Save CLEAN data (not raw) to file
-                clean_game_data = fetcher.extract_clean_game_data(game_summary, first_event)
-                with open("game_summary.json", "w") as f:
-                    json.dump(clean_game_data, f, indent=2)
-                print("\n[Clean box score data saved to game_summary.json]")
+                    # Save CLEAN data (not raw) to file
+                    clean_game_data = fetcher.extract_clean_game_data(game_summary, first_event)
+                    with open("game_summary.json", "wb") as f:
+                        f.write(orjson.dumps(clean_game_data, option=orjson.OPT_INDENT_2))
+                    print("\n[Clean box score data saved to game_summary.json]")
             
-            # Example 3: Get play-by-play data
-            print("\n" + "="*50)
-            print("3. Fetching play-by-play data (first 10 plays)...")
-            plays_data = fetcher.get_play_by_play(first_event_id, limit=10)
+                # Example 3: Get play-by-play data
+                print("\n" + "="*50)
+                print("3. Fetching play-by-play data (first 10 plays)...")
+                play_texts = await fetcher.get_play_texts(first_event_id, limit=10)
             
-            if plays_data and "items" in plays_data:
-                print(f"Retrieved {len(plays_data['items'])} plays")
-                for i, play in enumerate(plays_data["items"][:5], 1):
-                    # Handle different play data structures
-                    if isinstance(play, dict):
-                        # Try to get text from various possible locations
-                        if "text" in play:
-                            if isinstance(play["text"], dict):
-                                play_text = play["text"].get("shortText", play["text"].get("text", "N/A"))
-                            else:
-                                play_text = play["text"]
-                        else:
-                            play_text = play.get("description", play.get("play", {}).get("text", "N/A"))
-                    else:
-                        play_text = str(play)
-                    print(f"  Play {i}: {play_text}")
-    else:
-        print("No games found or error fetching data")
-        print("\nTrying with a different week...")
+                if play_texts:
+                    print(f"Retrieved {len(play_texts)} plays")
+                    sys.stdout.write("".join(f"  Play {i}: {text}\n" for i, text in enumerate(play_texts[:5], 1)))
+        else:
+            print("No games found or error fetching data")
+            print("\nTrying with a different week...")
         
-        # Try week 10 as fallback
-        scoreboard = fetcher.get_scoreboard(year=2023, season_type=2, week=10)
-        if scoreboard and "events" in scoreboard:
-            print(f"Found {len(scoreboard['events'])} games from 2023 Week 10")
+            # Try week 10 as fallback
+            scoreboard = fallback_scoreboard
+            if scoreboard and "events" in scoreboard:
+                print(f"Found {len(scoreboard['events'])} games from 2023 Week 10")
     
-    print("\n" + "="*50)
-    print("Note: This uses ESPN's public API endpoints.")
-    print("\nTo download all games from a season, run:")
-    print("  uv run main.py download-season [year]")
-    print("\nExample:")
-    print("  uv run main.py download-season 2023")
-    print("\nThis will save all games to the 'nflgames' folder.")
+        print("\n" + "="*50)
+        print("Note: This uses ESPN's public API endpoints.")
+        print("\nTo download all games from a season, run:")
+        print("  uv run main.py download-season [year]")
+        print("\nExample:")
+        print("  uv run main.py download-season 2023")
+        print("\nThis will save all games to nflgames/nfl_<year>.jsonl.")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())